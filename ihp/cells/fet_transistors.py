@@ -30,16 +30,19 @@ def _fix(value):
 
 def _grid_fix(x: float) -> float:
     """Snap to manufacturing grid (matches PyCell GridFix/tog/Snap)."""
-    return _fix(x * (1.0 / TECH.grid) + TECH.epsilon) * TECH.grid
+    # The scaled value is always a float, so floor it directly instead of
+    # going through _fix().
+    return math.floor(x * (1.0 / TECH.grid) + TECH.epsilon) * TECH.grid
 
 
 def _add_rect(
     c: Component, layer: LayerSpec, x1: float, y1: float, x2: float, y2: float
 ):
-    """Add a rectangle directly as a polygon (no sub-cell hierarchy).
+    """Add a rectangle directly as a box shape (no sub-cell hierarchy).
 
-    Using add_polygon avoids sub-cell + transform indirection that can
-    introduce 1-dbu rounding mismatches during hierarchy flattening.
+    Inserting into the cell's shapes avoids sub-cell + transform indirection
+    that can introduce 1-dbu rounding mismatches during hierarchy flattening,
+    and skips the point-list to polygon conversion of add_polygon.
     """
     if x1 > x2:
         x1, x2 = x2, x1
@@ -47,7 +50,7 @@ def _add_rect(
         y1, y2 = y2, y1
     if x2 - x1 <= 0 or y2 - y1 <= 0:
         return
-    c.add_polygon([(x1, y1), (x2, y1), (x2, y2), (x1, y2)], layer=layer)
+    c.shapes(gf.get_layer(layer)).insert(gf.kdb.DBox(x1, y1, x2, y2))
 
 
 def _place_contacts(
@@ -100,26 +103,27 @@ def _place_contacts(
     else:
         x_start = ox
 
-    for _i in range(int(nx)):
-        if ny == 1:
-            y = (h - ws) / 2
-        else:
-            y = oy
-
-        for _j in range(int(ny)):
-            cx = _grid_fix(xl + x_start)
-            cy = _grid_fix(yl + y)
-            _add_rect(
-                c,
-                layer_cont,
-                cx,
-                cy,
-                _grid_fix(xl + x_start + ws),
-                _grid_fix(yl + y + ws),
-            )
-            y += ws + dsy
+    if ny == 1:
+        y_start = (h - ws) / 2
+    else:
+        y_start = oy
+    step_x = ws + dsx
+    step_y = ws + dsy
+
+    # Each row of contacts shares the same snapped y extents, so snap them
+    # once and reuse them for every column.
+    rows = []
+    y = y_start
+    for _j in range(int(ny)):
+        rows.append((_grid_fix(yl + y), _grid_fix(yl + y + ws)))
+        y += step_y
 
-        x_start += ws + dsx
+    for _i in range(int(nx)):
+        cx1 = _grid_fix(xl + x_start)
+        cx2 = _grid_fix(xl + x_start + ws)
+        for cy1, cy2 in rows:
+            _add_rect(c, layer_cont, cx1, cy1, cx2, cy2)
+        x_start += step_x
 
 
 def _even_dbu(w):
@@ -155,6 +159,17 @@ def _mos_core(
     Exactly replicates nmos_code.py / pmos_code.py / nmosHV_code.py / pmosHV_code.py.
     """
     c = Component()
+    layer_gatpoly = gf.get_layer(layer_gatpoly)
+    layer_activ = gf.get_layer(layer_activ)
+    layer_cont = gf.get_layer(layer_cont)
+    layer_metal1 = gf.get_layer(layer_metal1)
+    layer_psd = gf.get_layer(layer_psd)
+    layer_nwell = gf.get_layer(layer_nwell)
+    layer_thickgateox = gf.get_layer(layer_thickgateox)
+    layer_heattrans = gf.get_layer(layer_heattrans)
+    layer_substrate = gf.get_layer(layer_substrate)
+    layer_metal1_pin = gf.get_layer(layer_metal1_pin)
+    layer_gatpoly_pin = gf.get_layer(layer_gatpoly_pin)
 
     # Tech params
     epsilon = TECH.epsilon
@@ -277,15 +292,28 @@ def _mos_core(
     src_y = (yMet1 + yMet2) / 2
     port_height = yMet2 - yMet1
 
+    # Y extents shared by every S/D column diffusion and every gate finger
+    yact_beg = ycont_beg - cont_Activ_overRec
+    yact_end = ycont_beg + cont_size + cont_Activ_overRec
+    ypoly_beg = ydiff_beg - gatpoly_Activ_over
+    ypoly_end = ydiff_end + gatpoly_Activ_over
+    ygate_beg = ypoly_beg + diffoffset
+    ygate_end = ypoly_end + diffoffset
+    # The per-column diffusion only widens the Activ around the contacts
+    # (dog-bone) for narrow devices; otherwise the spanning rectangle drawn
+    # after the loop already covers it.
+    col_activ = w < contActMin
+
     # Source diffusion (Activ)
-    _add_rect(
-        c,
-        layer_activ,
-        xcont_beg - cont_Activ_overRec,
-        ycont_beg - cont_Activ_overRec,
-        xcont_end + cont_Activ_overRec,
-        ycont_beg + cont_size + cont_Activ_overRec,
-    )
+    if col_activ:
+        _add_rect(
+            c,
+            layer_activ,
+            xcont_beg - cont_Activ_overRec,
+            yact_beg,
+            xcont_end + cont_Activ_overRec,
+            yact_end,
+        )
 
     # -----------------------------------------------------------------------
     # Gate fingers loop
@@ -294,17 +322,15 @@ def _mos_core(
     for i in range(1, ng + 1):
         # Poly gate
         xpoly_beg = xcont_end + gatpoly_cont_dist
-        ypoly_beg = ydiff_beg - gatpoly_Activ_over
         xpoly_end = xpoly_beg + gate_length
-        ypoly_end = ydiff_end + gatpoly_Activ_over
 
         _add_rect(
             c,
             layer_gatpoly,
             xpoly_beg,
-            ypoly_beg + diffoffset,
+            ygate_beg,
             xpoly_end,
-            ypoly_end + diffoffset,
+            ygate_end,
         )
 
         # HeatTrans layer (thermal marker)
@@ -312,9 +338,9 @@ def _mos_core(
             c,
             layer_heattrans,
             xpoly_beg,
-            ypoly_beg + diffoffset,
+            ygate_beg,
             xpoly_end,
-            ypoly_end + diffoffset,
+            ygate_end,
         )
 
         # Gate pin (first finger only, matching onep(i) check)
@@ -323,9 +349,9 @@ def _mos_core(
                 c,
                 pin_layer_poly,
                 xpoly_beg,
-                ypoly_beg + diffoffset,
+                ygate_beg,
                 xpoly_end,
-                ypoly_end + diffoffset,
+                ygate_end,
             )
             gate_x = (xpoly_beg + xpoly_end) / 2
             gate_y = (ypoly_beg + ypoly_end) / 2 + diffoffset
@@ -333,8 +359,6 @@ def _mos_core(
 
         # Drain/next-source contact column
         xcont_beg = xpoly_end + gatpoly_cont_dist
-        ycont_beg = ydiff_beg + cont_Activ_overRec
-        ycont_cnt = ycont_beg + diffoffset + diff_cont_offset
         xcont_end = xcont_beg + cont_size
 
         # Metal1 for this S/D column
@@ -375,14 +399,15 @@ def _mos_core(
             drain_y = src_y
 
         # Drain/source diffusion (Activ)
-        _add_rect(
-            c,
-            layer_activ,
-            xcont_beg - cont_Activ_overRec,
-            ycont_beg - cont_Activ_overRec,
-            xcont_end + cont_Activ_overRec,
-            ycont_beg + cont_size + cont_Activ_overRec,
-        )
+        if col_activ:
+            _add_rect(
+                c,
+                layer_activ,
+                xcont_beg - cont_Activ_overRec,
+                yact_beg,
+                xcont_end + cont_Activ_overRec,
+                yact_end,
+            )
 
     # -----------------------------------------------------------------------
     # Spanning diffusion rectangle
@@ -432,9 +457,9 @@ def _mos_core(
             c,
             layer_substrate,
             xcont_beg - cont_Activ_overRec,
-            ycont_beg - cont_Activ_overRec,
+            yact_beg,
             xcont_end + cont_Activ_overRec,
-            ycont_beg + cont_size + cont_Activ_overRec,
+            yact_end,
         )
 
     # -----------------------------------------------------------------------
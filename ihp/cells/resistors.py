@@ -6,19 +6,263 @@ from gdsfactory.typings import LayerSpec
 
 from ihp.tech import TECH as _TECH
 
+# Grid used to snap resistor dimensions (in micrometers)
+_GRID = 0.005
+
+# Resistor design rules (in micrometers, sheet resistance in ohms/square)
+_RESISTOR_RULES = {
+    "rsil": {
+        "min_dy": 0.4,
+        "min_dx": 0.4,
+        "sheet_resistance": 7.0,
+        "gat_dy": 0.35,
+        "metal_pad_dy": 0.26,
+        "gat_metal_margin_dx": 0.02,
+        "gat_metal_margin_dy": 0.02,
+        "metal_contact_margin_dx": 0.05,
+        "metal_contact_margin_dy": 0.05,
+        "block_margin": 0.18,
+    },
+    "rppd": {
+        "min_dy": 0.4,
+        "min_dx": 0.5,
+        "sheet_resistance": 300.0,
+        "gat_dy": 0.43,
+        "metal_pad_dy": 0.30,
+        "gat_metal_margin_dx": 0.02,
+        "gat_metal_margin_dy": 0.00,
+        "metal_contact_margin_dx": 0.05,
+        "metal_contact_margin_dy": 0.07,
+        "block_margin": 0.18,
+        "block2_margin": 0.02,
+    },
+    "rhigh": {
+        "min_dy": 0.4,
+        "min_dx": 0.5,
+        "sheet_resistance": 300.0,
+        "gat_dy": 0.43,
+        "metal_pad_dy": 0.26,
+        "gat_metal_margin_dx": 0.02,
+        "gat_metal_margin_dy": 0.02,
+        "metal_contact_margin_dx": 0.05,
+        "metal_contact_margin_dy": 0.05,
+        "block_margin": 0.18,
+        "block2_margin": 0.02,
+    },
+}
+
 
 def add_rect(
     component,
     size: tuple[float, float],
     layer: LayerSpec,
     origin: tuple[float, float],
-    centered: bool = False,
 ):
-    """Create rectangle, add ref to component and move to origin, return ref."""
-    rect = gf.components.rectangle(size=size, layer=layer, centered=centered)
-    ref = component.add_ref(rect)
-    ref.move(origin)
-    return ref
+    """Add a rectangle with its lower-left corner at origin, return the shape.
+
+    The rectangle is added directly as a polygon, so no rectangle sub-cell,
+    reference or move transform is created per shape.
+    """
+    x0, y0 = origin
+    x1 = x0 + size[0]
+    y1 = y0 + size[1]
+    return component.add_polygon([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], layer=layer)
+
+
+def _add_rect_layers(
+    component,
+    size: tuple[float, float],
+    layers: tuple[LayerSpec, ...],
+    origin: tuple[float, float],
+) -> None:
+    """Add the same rectangle on every layer in layers from one point list."""
+    x0, y0 = origin
+    x1 = x0 + size[0]
+    y1 = y0 + size[1]
+    points = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+    for layer in layers:
+        component.add_polygon(points, layer=layer)
+
+
+def _snap_size(
+    dy: float, dx: float, resistance: float | None, rules: dict[str, float]
+) -> tuple[float, float, float, float]:
+    """Clamp and grid-snap a resistor size, return (dy, dx, n_squares, resistance).
+
+    When resistance is None it is derived from the number of squares and the
+    sheet resistance in rules.
+    """
+    dy = round(max(dy, rules["min_dy"]) / _GRID) * _GRID
+    dx = round(max(dx, rules["min_dx"]) / _GRID) * _GRID
+    n_squares = dy / dx
+    if resistance is None:
+        resistance = n_squares * rules["sheet_resistance"]
+    return dy, dx, n_squares, resistance
+
+
+def _add_pad_ports(
+    component,
+    center_x: float,
+    upper_y: float,
+    lower_y: float,
+    width: float,
+    layer: LayerSpec,
+) -> None:
+    """Add the electrical ports P1 (upper pad, facing up) and P2 (lower pad)."""
+    for name, center_y, orientation in (("P1", upper_y, 90), ("P2", lower_y, 270)):
+        component.add_port(
+            name=name,
+            center=(center_x, center_y),
+            width=width,
+            orientation=orientation,
+            layer=layer,
+            port_type="electrical",
+        )
+
+
+def _poly_resistor(
+    name: str,
+    dy: float,
+    dx: float,
+    resistance: float | None,
+    model: str,
+    body_layers: tuple[LayerSpec, ...],
+    layer_gate: LayerSpec,
+    layer_contact: LayerSpec,
+    layer_metal1: LayerSpec,
+    layer_metal1_pin: LayerSpec,
+    block_layers: tuple[LayerSpec, ...],
+    block2_layers: tuple[LayerSpec, ...] = (),
+    terminal2: str = "3",
+) -> Component:
+    """Draw a vertical poly resistor, shared by rsil, rppd and rhigh.
+
+    The body spans (0, 0)-(dx, dy) with a gate poly extension above and below.
+    Each extension carries a Metal1 pad with one contact. The blocking
+    rectangle covers body and extensions; the optional second block only
+    covers the body. Device-specific values come from _RESISTOR_RULES[name].
+
+    Args:
+        name: device name, used for rules, TECH limits and error messages.
+        dy: length of the resistor in micrometers.
+        dx: width of the resistor in micrometers.
+        resistance: Target resistance in ohms (optional).
+        model: Device model name.
+        body_layers: layers drawn with the resistor body footprint.
+        layer_gate: Gate polysilicon layer.
+        layer_contact: Contact layer.
+        layer_metal1: Metal1 layer.
+        layer_metal1_pin: Metal1 pin layer.
+        block_layers: layers drawn with the blocking rectangle.
+        block2_layers: layers drawn with the second blocking rectangle.
+        terminal2: subcircuit terminal of the lower pad (P2).
+    """
+    min_dx = getattr(_TECH, f"{name}_min_width")
+    max_dx = getattr(_TECH, f"{name}_max_width")
+    min_dy = getattr(_TECH, f"{name}_min_length")
+    max_dy = getattr(_TECH, f"{name}_max_length")
+    if dx < min_dx or dx > max_dx:
+        raise ValueError(f"{name} dx={dx} out of range [{min_dx}, {max_dx}]")
+    if dy < min_dy or dy > max_dy:
+        raise ValueError(f"{name} dy={dy} out of range [{min_dy}, {max_dy}]")
+
+    c = Component()
+
+    # Resolve layer specs once so each shape below skips the PDK name lookup
+    body_layers = tuple(gf.get_layer(layer) for layer in body_layers)
+    block_layers = tuple(gf.get_layer(layer) for layer in block_layers)
+    block2_layers = tuple(gf.get_layer(layer) for layer in block2_layers)
+    layer_gate = gf.get_layer(layer_gate)
+    layer_contact = gf.get_layer(layer_contact)
+    layer_metal1 = gf.get_layer(layer_metal1)
+    layer_metal1_pin = gf.get_layer(layer_metal1_pin)
+
+    rules = _RESISTOR_RULES[name]
+    gat_dy = rules["gat_dy"]
+    gat_metal_margin_dx = rules["gat_metal_margin_dx"]
+    gat_metal_margin_dy = rules["gat_metal_margin_dy"]
+    metal_contact_margin_dx = rules["metal_contact_margin_dx"]
+    metal_contact_margin_dy = rules["metal_contact_margin_dy"]
+    block_margin = rules["block_margin"]
+
+    # Snap to grid and derive the resistance
+    dy, dx, n_squares, resistance = _snap_size(dy, dx, resistance, rules)
+
+    # Metal pads on the gate extensions
+    metal_pad_dx = dx - 2 * gat_metal_margin_dx
+    metal_pad_dy = rules["metal_pad_dy"]
+    metal_pad_left_x = gat_metal_margin_dx
+    metal_pad_upper_y = dy + gat_dy - metal_pad_dy - gat_metal_margin_dy
+    metal_pad_lower_y = -gat_dy + gat_metal_margin_dy
+
+    # Contacts inside the metal pads
+    contact_dx = metal_pad_dx - 2 * metal_contact_margin_dx
+    contact_dy = metal_pad_dy - 2 * metal_contact_margin_dy
+    contact_left_x = metal_pad_left_x + metal_contact_margin_dx
+
+    # Blocking rectangles: the first covers body and extensions, the second
+    # is wider and only spans the body
+    block_dx = dx + 2 * block_margin
+    block_dy = dy + 2 * (gat_dy + block_margin)
+    blocks = [((block_dx, block_dy), block_layers)]
+    if block2_layers:
+        blocks.append(((block_dx + 2 * rules["block2_margin"], dy), block2_layers))
+
+    # Resistor body, bottom-left at (0, 0)
+    _add_rect_layers(c, (dx, dy), body_layers, (0.0, 0.0))
+
+    # Gate extensions, contacts and metal pads (top and bottom)
+    for y in (dy, -gat_dy):
+        add_rect(c, size=(dx, gat_dy), layer=layer_gate, origin=(0.0, y))
+    for y in (metal_pad_upper_y, metal_pad_lower_y):
+        add_rect(
+            c,
+            size=(contact_dx, contact_dy),
+            layer=layer_contact,
+            origin=(contact_left_x, y + metal_contact_margin_dy),
+        )
+        _add_rect_layers(
+            c,
+            (metal_pad_dx, metal_pad_dy),
+            (layer_metal1_pin, layer_metal1),
+            (metal_pad_left_x, y),
+        )
+
+    # Blocking layers, centered on the body
+    for size, layers in blocks:
+        origin = ((dx - size[0]) / 2.0, (dy - size[1]) / 2.0)
+        _add_rect_layers(c, size, layers, origin)
+
+    _add_pad_ports(
+        c,
+        metal_pad_left_x + metal_pad_dx / 2.0,
+        metal_pad_upper_y + metal_pad_dy / 2.0,
+        metal_pad_lower_y + metal_pad_dy / 2.0,
+        metal_pad_dx,
+        layer_metal1_pin,
+    )
+
+    # Metadata, including VLSIR simulation metadata
+    c.info.update(
+        {
+            "model": model,
+            "dy": dy,
+            "dx": dx,
+            "resistance": resistance,
+            "sheet_resistance": rules["sheet_resistance"],
+            "n_squares": n_squares,
+            "vlsir": {
+                "model": model,
+                "spice_type": "SUBCKT",
+                "spice_lib": "resistors_mod.lib",
+                "port_order": ["1", terminal2, "bn"],
+                "port_map": {"P1": "1", "P2": terminal2},
+                "params": {"w": dx * 1e-6, "l": dy * 1e-6, "m": 1},
+            },
+        }
+    )
+
+    return c
 
 
 @gf.cell
@@ -58,157 +302,21 @@ def rsil(
     Raises:
         ValueError: If dx (width) or dy (length) is outside allowed range.
     """
-    if dx < _TECH.rsil_min_width or dx > _TECH.rsil_max_width:
-        raise ValueError(
-            f"rsil dx={dx} out of range [{_TECH.rsil_min_width}, {_TECH.rsil_max_width}]"
-        )
-    if dy < _TECH.rsil_min_length or dy > _TECH.rsil_max_length:
-        raise ValueError(
-            f"rsil dy={dy} out of range [{_TECH.rsil_min_length}, {_TECH.rsil_max_length}]"
-        )
-
-    c = Component()
-
-    # Constants
-    RSIL_MIN_DY = 0.4
-    RSIL_MIN_DX = 0.4
-    GRID = 0.005
-
-    SHEET_RESISTANCE = 7.0
-    GAT_DY = 0.35
-
-    # Geometry
-    METAL_PAD_DY = 0.26
-    GAT_METAL_MARGIN = 0.02
-    METAL_CONTACT_MARGIN = 0.05
-    BLOCK_MARGIN = 0.18
-
-    # Snap to grid
-    dy = max(dy, RSIL_MIN_DY)
-    dx = max(dx, RSIL_MIN_DX)
-    dy = round(dy / GRID) * GRID
-    dx = round(dx / GRID) * GRID
-
-    # Resistance calculation
-    if resistance is None:
-        n_squares = dy / dx
-        resistance = n_squares * SHEET_RESISTANCE
-    else:
-        n_squares = dy / dx
-
-    # Compute geometry
-    # Resistor body bottom-left at (0,0)
-    body_origin = (0.0, 0.0)
-
-    # Pad sizes
-    metal_pad_dx = dx - 2 * GAT_METAL_MARGIN
-    metal_pad_dy = METAL_PAD_DY
-
-    # Pad coordinates
-    metal_pad_left_x = GAT_METAL_MARGIN
-    metal_pad_upper_y = dy + GAT_DY - metal_pad_dy - GAT_METAL_MARGIN
-    metal_pad_lower_y = -GAT_DY + GAT_METAL_MARGIN
-
-    # Contacts inside pads
-    contact_dx = metal_pad_dx - 2 * METAL_CONTACT_MARGIN
-    contact_dy = metal_pad_dy - 2 * METAL_CONTACT_MARGIN
-    contact_x = metal_pad_left_x + METAL_CONTACT_MARGIN
-    contact_upper_y = metal_pad_upper_y + METAL_CONTACT_MARGIN
-    contact_lower_y = metal_pad_lower_y + METAL_CONTACT_MARGIN
-
-    # blocking rectangle size & origin
-    block_dx = dx + 2 * BLOCK_MARGIN
-    block_dy = dy + 2 * (GAT_DY + BLOCK_MARGIN)
-    block_origin = ((dx - block_dx) / 2.0, (dy - block_dy) / 2.0)
-
-    # Draw resistor body (polysilicon + heat + res marker)
-    for ly in (layer_poly, layer_heat, layer_res_mark):
-        add_rect(c, size=(dx, dy), layer=ly, origin=body_origin)
-
-    # Gate extensions (top and bottom)
-    gate_size = (dx, GAT_DY)
-    add_rect(c, size=gate_size, layer=layer_gate, origin=(0.0, dy))
-    add_rect(c, size=gate_size, layer=layer_gate, origin=(0.0, -GAT_DY))
-
-    # Metal pads (pin then metal1)
-    for ly in (layer_metal1_pin, layer_metal1):
-        add_rect(
-            c,
-            size=(metal_pad_dx, metal_pad_dy),
-            layer=ly,
-            origin=(metal_pad_left_x, metal_pad_upper_y),
-        )
-        add_rect(
-            c,
-            size=(metal_pad_dx, metal_pad_dy),
-            layer=ly,
-            origin=(metal_pad_left_x, metal_pad_lower_y),
-        )
-
-    # Contacts (inside metal pads)
-    add_rect(
-        c,
-        size=(contact_dx, contact_dy),
-        layer=layer_contact,
-        origin=(contact_x, contact_upper_y),
-    )
-    add_rect(
-        c,
-        size=(contact_dx, contact_dy),
-        layer=layer_contact,
-        origin=(contact_x, contact_lower_y),
-    )
-
-    # Blocking layer
-    add_rect(c, size=(block_dx, block_dy), layer=layer_block, origin=block_origin)
-
-    # Ports (derive from pad geometry)
-    pad_center_x = metal_pad_left_x + metal_pad_dx / 2.0
-    pad_upper_center_y = metal_pad_upper_y + metal_pad_dy / 2.0
-    pad_lower_center_y = metal_pad_lower_y + metal_pad_dy / 2.0
-
-    c.add_port(
-        name="P1",
-        center=(pad_center_x, pad_upper_center_y),
-        width=metal_pad_dx,
-        orientation=90,
-        layer=layer_metal1_pin,
-        port_type="electrical",
-    )
-
-    c.add_port(
-        name="P2",
-        center=(pad_center_x, pad_lower_center_y),
-        width=metal_pad_dx,
-        orientation=270,
-        layer=layer_metal1_pin,
-        port_type="electrical",
-    )
-
-    # Metadata
-    c.info.update(
-        {
-            "model": model,
-            "dy": dy,
-            "dx": dx,
-            "resistance": resistance,
-            "sheet_resistance": SHEET_RESISTANCE,
-            "n_squares": n_squares,
-        }
+    return _poly_resistor(
+        "rsil",
+        dy,
+        dx,
+        resistance,
+        model,
+        body_layers=(layer_poly, layer_heat, layer_res_mark),
+        layer_gate=layer_gate,
+        layer_contact=layer_contact,
+        layer_metal1=layer_metal1,
+        layer_metal1_pin=layer_metal1_pin,
+        block_layers=(layer_block,),
+        terminal2="2",
     )
 
-    # VLSIR simulation metadata
-    c.info["vlsir"] = {
-        "model": model,
-        "spice_type": "SUBCKT",
-        "spice_lib": "resistors_mod.lib",
-        "port_order": ["1", "2", "bn"],
-        "port_map": {"P1": "1", "P2": "2"},
-        "params": {"w": dx * 1e-6, "l": dy * 1e-6, "m": 1},
-    }
-
-    return c
-
 
 @gf.cell
 def rppd(
@@ -249,169 +357,21 @@ def rppd(
     Raises:
         ValueError: If dx (width) or dy (length) is outside allowed range.
     """
-    if dx < _TECH.rppd_min_width or dx > _TECH.rppd_max_width:
-        raise ValueError(
-            f"rppd dx={dx} out of range [{_TECH.rppd_min_width}, {_TECH.rppd_max_width}]"
-        )
-    if dy < _TECH.rppd_min_length or dy > _TECH.rppd_max_length:
-        raise ValueError(
-            f"rppd dy={dy} out of range [{_TECH.rppd_min_length}, {_TECH.rppd_max_length}]"
-        )
-
-    c = Component()
-
-    # Constants
-    RPPD_MIN_DY = 0.4
-    RPPD_MIN_DX = 0.5
-    GRID = 0.005
-
-    SHEET_RESISTANCE = 300.0
-    GAT_DY = 0.43
-
-    # Geometry
-    METAL_PAD_DY = 0.30
-    METAL_CONTACT_MARGIN_DX = 0.05
-    METAL_CONTACT_MARGIN_DY = 0.07
-    GAT_METAL_MARGIN_DX = 0.02
-    GAT_METAL_MARGIN_DY = 0.00
-
-    BLOCK_MARGIN = 0.18
-    BLOCK2_MARGIN = 0.02
-
-    # Snap to grid
-    dy = max(dy, RPPD_MIN_DY)
-    dx = max(dx, RPPD_MIN_DX)
-    dy = round(dy / GRID) * GRID
-    dx = round(dx / GRID) * GRID
-
-    # Resistance calculation
-    if resistance is None:
-        n_squares = dy / dx
-        resistance = n_squares * SHEET_RESISTANCE
-    else:
-        n_squares = dy / dx
-
-    # Geometry
-    body_origin = (0.0, 0.0)
-
-    # Metal pad sizes
-    metal_pad_dx = dx - 2 * GAT_METAL_MARGIN_DX
-    metal_pad_dy = METAL_PAD_DY
-
-    # Metal pad coordinates
-    metal_pad_left_x = GAT_METAL_MARGIN_DX
-    metal_pad_upper_y = dy + GAT_DY - metal_pad_dy - GAT_METAL_MARGIN_DY
-    metal_pad_lower_y = -GAT_DY + GAT_METAL_MARGIN_DY
-
-    # Contact sizes
-    contact_dx = metal_pad_dx - 2 * METAL_CONTACT_MARGIN_DX
-    contact_dy = metal_pad_dy - 2 * METAL_CONTACT_MARGIN_DY
-
-    contact_left_x = metal_pad_left_x + METAL_CONTACT_MARGIN_DX
-    contact_upper_y = metal_pad_upper_y + METAL_CONTACT_MARGIN_DY
-    contact_lower_y = metal_pad_lower_y + METAL_CONTACT_MARGIN_DY
-
-    # Blocking layers
-    block_dx = dx + 2 * BLOCK_MARGIN
-    block_dy = dy + 2 * (GAT_DY + BLOCK_MARGIN)
-    block_origin = ((dx - block_dx) / 2.0, (dy - block_dy) / 2.0)
-
-    block2_dx = block_dx + 2 * BLOCK2_MARGIN
-    block2_dy = dy
-    block2_origin = ((dx - block2_dx) / 2.0, (dy - block2_dy) / 2.0)
-
-    # Draw resistor body
-    for ly in (layer_poly, layer_heat):
-        add_rect(c, size=(dx, dy), layer=ly, origin=body_origin)
-
-    # Gate poly extensions
-    gate_size = (dx, GAT_DY)
-    add_rect(c, size=gate_size, layer=layer_gate, origin=(0.0, dy))
-    add_rect(c, size=gate_size, layer=layer_gate, origin=(0.0, -GAT_DY))
-
-    # Contacts
-    add_rect(
-        c,
-        size=(contact_dx, contact_dy),
-        layer=layer_contact,
-        origin=(contact_left_x, contact_upper_y),
-    )
-    add_rect(
-        c,
-        size=(contact_dx, contact_dy),
-        layer=layer_contact,
-        origin=(contact_left_x, contact_lower_y),
+    return _poly_resistor(
+        "rppd",
+        dy,
+        dx,
+        resistance,
+        model,
+        body_layers=(layer_poly, layer_heat),
+        layer_gate=layer_gate,
+        layer_contact=layer_contact,
+        layer_metal1=layer_metal1,
+        layer_metal1_pin=layer_metal1_pin,
+        block_layers=(layer_block, layer_pSD),
+        block2_layers=(layer_block, layer_sal_block),
     )
 
-    # Metal pads (pin + metal1)
-    for ly in (layer_metal1_pin, layer_metal1):
-        add_rect(
-            c,
-            size=(metal_pad_dx, metal_pad_dy),
-            layer=ly,
-            origin=(metal_pad_left_x, metal_pad_upper_y),
-        )
-        add_rect(
-            c,
-            size=(metal_pad_dx, metal_pad_dy),
-            layer=ly,
-            origin=(metal_pad_left_x, metal_pad_lower_y),
-        )
-
-    # Blocking layers
-    for ly in (layer_block, layer_pSD):
-        add_rect(c, size=(block_dx, block_dy), layer=ly, origin=block_origin)
-
-    for ly in (layer_block, layer_sal_block):
-        add_rect(c, size=(block2_dx, block2_dy), layer=ly, origin=block2_origin)
-
-    # Ports
-    metal_pad_center_x = metal_pad_left_x + metal_pad_dx / 2.0
-    metal_pad_upper_center_y = metal_pad_upper_y + metal_pad_dy / 2.0
-    metal_pad_lower_center_y = metal_pad_lower_y + metal_pad_dy / 2.0
-
-    c.add_port(
-        name="P1",
-        center=(metal_pad_center_x, metal_pad_upper_center_y),
-        width=metal_pad_dx,
-        orientation=90,
-        layer=layer_metal1_pin,
-        port_type="electrical",
-    )
-
-    c.add_port(
-        name="P2",
-        center=(metal_pad_center_x, metal_pad_lower_center_y),
-        width=metal_pad_dx,
-        orientation=270,
-        layer=layer_metal1_pin,
-        port_type="electrical",
-    )
-
-    # Metadata
-    c.info.update(
-        {
-            "model": model,
-            "dy": dy,
-            "dx": dx,
-            "resistance": resistance,
-            "sheet_resistance": SHEET_RESISTANCE,
-            "n_squares": n_squares,
-        }
-    )
-
-    # VLSIR simulation metadata
-    c.info["vlsir"] = {
-        "model": model,
-        "spice_type": "SUBCKT",
-        "spice_lib": "resistors_mod.lib",
-        "port_order": ["1", "3", "bn"],
-        "port_map": {"P1": "1", "P2": "3"},
-        "params": {"w": dx * 1e-6, "l": dy * 1e-6, "m": 1},
-    }
-
-    return c
-
 
 @gf.cell
 def rhigh(
@@ -454,168 +414,21 @@ def rhigh(
     Raises:
         ValueError: If dx (width) or dy (length) is outside allowed range.
     """
-    if dx < _TECH.rhigh_min_width or dx > _TECH.rhigh_max_width:
-        raise ValueError(
-            f"rhigh dx={dx} out of range [{_TECH.rhigh_min_width}, {_TECH.rhigh_max_width}]"
-        )
-    if dy < _TECH.rhigh_min_length or dy > _TECH.rhigh_max_length:
-        raise ValueError(
-            f"rhigh dy={dy} out of range [{_TECH.rhigh_min_length}, {_TECH.rhigh_max_length}]"
-        )
-
-    c = Component()
-
-    # Constants
-    RHIGH_MIN_DY = 0.4
-    RHIGH_MIN_DX = 0.5
-    GRID = 0.005
-
-    SHEET_RESISTANCE = 300.0
-    GAT_DY = 0.43
-
-    # Fundamental geometry constants
-    METAL_PAD_DY = 0.26
-    METAL_CONTACT_MARGIN = 0.05
-    GAT_METAL_MARGIN = 0.02
-
-    BLOCK1_MARGIN = 0.18
-    BLOCK2_MARGIN = 0.02
-
-    # Snap to grid
-    dy = max(dy, RHIGH_MIN_DY)
-    dx = max(dx, RHIGH_MIN_DX)
-    dy = round(dy / GRID) * GRID
-    dx = round(dx / GRID) * GRID
-
-    # Resistance calculation
-    if resistance is None:
-        n_squares = dy / dx
-        resistance = n_squares * SHEET_RESISTANCE
-    else:
-        n_squares = dy / dx
-
-    # Compute geometry
-    body_origin = (0.0, 0.0)
-
-    # Metal pad sizes
-    metal_pad_dx = dx - 2 * GAT_METAL_MARGIN
-    metal_pad_dy = METAL_PAD_DY
-
-    # Metal pad positions
-    metal_pad_left_x = GAT_METAL_MARGIN
-    metal_pad_upper_y = dy + GAT_DY - metal_pad_dy - GAT_METAL_MARGIN
-    metal_pad_lower_y = -GAT_DY + GAT_METAL_MARGIN
-
-    # Contacts inside metal pads
-    contact_dx = metal_pad_dx - 2 * METAL_CONTACT_MARGIN
-    contact_dy = metal_pad_dy - 2 * METAL_CONTACT_MARGIN
-
-    contact_left_x = metal_pad_left_x + METAL_CONTACT_MARGIN
-    contact_upper_y = metal_pad_upper_y + METAL_CONTACT_MARGIN
-    contact_lower_y = metal_pad_lower_y + METAL_CONTACT_MARGIN
-
-    # Blocking layer geometry
-    block1_dx = dx + 2 * BLOCK1_MARGIN
-    block1_dy = dy + 2 * (GAT_DY + BLOCK1_MARGIN)
-    block1_origin = ((dx - block1_dx) / 2, (dy - block1_dy) / 2)
-
-    block2_dx = block1_dx + 2 * BLOCK2_MARGIN
-    block2_dy = dy
-    block2_origin = ((dx - block2_dx) / 2, (dy - block2_dy) / 2)
-
-    # Draw resistor body (poly + heat)
-    for ly in (layer_poly, layer_heat):
-        add_rect(c, size=(dx, dy), layer=ly, origin=body_origin)
-
-    # Gate extensions
-    gate_size = (dx, GAT_DY)
-    add_rect(c, gate_size, layer_gate, origin=(0.0, dy))
-    add_rect(c, gate_size, layer_gate, origin=(0.0, -GAT_DY))
-
-    # Contacts
-    add_rect(
-        c,
-        (contact_dx, contact_dy),
-        layer_contact,
-        origin=(contact_left_x, contact_upper_y),
-    )
-    add_rect(
-        c,
-        (contact_dx, contact_dy),
-        layer_contact,
-        origin=(contact_left_x, contact_lower_y),
-    )
-
-    # Metal pads
-    for ly in (layer_metal1_pin, layer_metal1):
-        add_rect(
-            c,
-            (metal_pad_dx, metal_pad_dy),
-            ly,
-            origin=(metal_pad_left_x, metal_pad_upper_y),
-        )
-        add_rect(
-            c,
-            (metal_pad_dx, metal_pad_dy),
-            ly,
-            origin=(metal_pad_left_x, metal_pad_lower_y),
-        )
-
-    # Blocking 1
-    for ly in (layer_block, layer_pSD, layer_nSD):
-        add_rect(c, (block1_dx, block1_dy), ly, origin=block1_origin)
-
-    # Blocking 2
-    for ly in (layer_block, layer_sal_block):
-        add_rect(c, (block2_dx, block2_dy), ly, origin=block2_origin)
-
-    # Ports
-    metal_pad_center_x = metal_pad_left_x + metal_pad_dx / 2.0
-    metal_pad_upper_center_y = metal_pad_upper_y + metal_pad_dy / 2.0
-    metal_pad_lower_center_y = metal_pad_lower_y + metal_pad_dy / 2.0
-
-    c.add_port(
-        name="P1",
-        center=(metal_pad_center_x, metal_pad_upper_center_y),
-        width=metal_pad_dx,
-        orientation=90,
-        layer=layer_metal1_pin,
-        port_type="electrical",
+    return _poly_resistor(
+        "rhigh",
+        dy,
+        dx,
+        resistance,
+        model,
+        body_layers=(layer_poly, layer_heat),
+        layer_gate=layer_gate,
+        layer_contact=layer_contact,
+        layer_metal1=layer_metal1,
+        layer_metal1_pin=layer_metal1_pin,
+        block_layers=(layer_block, layer_pSD, layer_nSD),
+        block2_layers=(layer_block, layer_sal_block),
     )
 
-    c.add_port(
-        name="P2",
-        center=(metal_pad_center_x, metal_pad_lower_center_y),
-        width=metal_pad_dx,
-        orientation=270,
-        layer=layer_metal1_pin,
-        port_type="electrical",
-    )
-
-    # Metadata
-    c.info.update(
-        {
-            "model": model,
-            "dy": dy,
-            "dx": dx,
-            "resistance": resistance,
-            "sheet_resistance": SHEET_RESISTANCE,
-            "n_squares": n_squares,
-        }
-    )
-
-    # VLSIR simulation metadata
-    c.info["vlsir"] = {
-        "model": model,
-        "spice_type": "SUBCKT",
-        "spice_lib": "resistors_mod.lib",
-        "port_order": ["1", "3", "bn"],
-        "port_map": {"P1": "1", "P2": "3"},
-        "params": {"w": dx * 1e-6, "l": dy * 1e-6, "m": 1},
-    }
-
-    return c
-
 
 if __name__ == "__main__":
     from gdsfactory.difftest import xor
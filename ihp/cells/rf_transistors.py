@@ -13,7 +13,7 @@ from gdsfactory import Component
 from gdsfactory.typings import LayerSpec
 
 from ..tech import TECH
-from .fet_transistors import _add_rect, _even_dbu, _fix, _grid_fix
+from .fet_transistors import _add_rect, _even_dbu, _grid_fix
 
 
 # ---------------------------------------------------------------------------
@@ -72,12 +72,12 @@ def _metal_cont(
         yl = p1_x - sw2
         xr = p1_x + sw2
         yges = y_top - y_bot - 2 * offset
-        nrect = _fix(math.floor((yges + cont_space) / (cont_length + cont_space)))
+        nrect = math.floor((yges + cont_space) / (cont_length + cont_space))
 
         if nrect > 1:
             rsp = (yges - nrect * cont_length) / (nrect - 1)
             yy = y_bot + offset
-            while yy + cont_length <= y_top - offset + 0.0001:
+            for _ in range(nrect):
                 _add_rect(
                     c,
                     layer_cont,
@@ -113,12 +113,12 @@ def _metal_cont(
         yb = p1_y - sw2
         yt = p1_y + sw2
         xges = x_right - x_left - 2 * offset
-        nrect = _fix(math.floor((xges + cont_space) / (cont_length + cont_space)))
+        nrect = math.floor((xges + cont_space) / (cont_length + cont_space))
 
         if nrect > 1:
             rsp = (xges - nrect * cont_length) / (nrect - 1)
             xx = x_left + offset
-            while xx + cont_length <= x_right - offset + 0.0001:
+            for _ in range(nrect):
                 _add_rect(
                     c,
                     layer_cont,
@@ -183,6 +183,16 @@ def _rf_mos_core(
     Exactly replicates rfmosfet_base_code.py genLayout().
     """
     c = Component()
+    layer_gatpoly = gf.get_layer(layer_gatpoly)
+    layer_activ = gf.get_layer(layer_activ)
+    layer_cont = gf.get_layer(layer_cont)
+    layer_metal1 = gf.get_layer(layer_metal1)
+    layer_metal2 = gf.get_layer(layer_metal2)
+    layer_via1 = gf.get_layer(layer_via1)
+    layer_psd = gf.get_layer(layer_psd)
+    layer_nwell = gf.get_layer(layer_nwell)
+    layer_thickgateox = gf.get_layer(layer_thickgateox)
+    layer_metal1_pin = gf.get_layer(layer_metal1_pin)
 
     # -- Dimensions --
     ngi = nf
@@ -192,7 +202,7 @@ def _rf_mos_core(
     met1_w1 = TECH.rf_guard_ring_m1_width
     contW = TECH.cont_size
     contS = TECH.cont_spacing
-    metWidth = TECH.cont_size + TECH.rf_sd_metal_width_over  # 0.30
+    metWidth = contW + TECH.rf_sd_metal_width_over  # 0.30
     viaW = TECH.via1_size_rf
     if W < TECH.via1_width_threshold:
         viaS = TECH.via1_spacing_narrow
@@ -272,7 +282,6 @@ def _rf_mos_core(
 
     # -- Gate fingers --
     y = ec
-    gate_rects = []
     for _i in range(1, ngi + 1):
         _add_rect(
             c,
@@ -282,7 +291,6 @@ def _rf_mos_core(
             ox + (W + dgatx),
             oy + (y + L),
         )
-        gate_rects.append((y, y + L))
         y = y + dc + L
 
     if cnt_rows == 1:
@@ -312,21 +320,20 @@ def _rf_mos_core(
     # Build S/D shapes for the first S/D region (below first gate)
     # These are then replicated for each gate finger via copying.
 
-    # For cnt_rows > 1, there's a connecting metal strip
-    sd_shapes = []  # Track shapes to be copied
-
     sd_mx = TECH.rf_sd_margin_x
     sd_my = TECH.rf_sd_margin_y
     sd_adj = TECH.rf_sd_metal_adjust
     sd_row_sp = TECH.rf_sd_row_spacing
     via_enc = TECH.via1_enc
-
-    if cnt_rows > 1:
-        sd_shapes.append((layer_metal1, sd_mx, sd_my, W - sd_mx, ec - sd_mx - dce))
+    # Loop invariants shared by the first S/D region and its copies
+    sd_met_w = metWidth - sd_adj
+    via_met_w = viaW + via_enc
+    sd_row_y0 = sd_my + metWidth * 0.5 - via_enc
+    sd_strip_yt = ec - sd_mx - dce
 
     p1_x = sd_mx
     p2_x = W - sd_mx
-    p1_y = sd_my + metWidth * 0.5 - via_enc
+    p1_y = sd_row_y0
     p2_y = p1_y
     for _i in range(1, cnt_rows + 1):
         _metal_cont(
@@ -337,7 +344,7 @@ def _rf_mos_core(
             p2_y,
             layer_metal1,
             layer_cont,
-            metWidth - sd_adj,
+            sd_met_w,
             contW,
             contW,
             sd_mx,
@@ -345,33 +352,14 @@ def _rf_mos_core(
             shift_x=ox,
             shift_y=oy,
         )
-        sd_shapes.append(
-            (
-                "metal_cont",
-                p1_x,
-                p1_y,
-                p2_x,
-                p2_y,
-                layer_metal1,
-                layer_cont,
-                metWidth - sd_adj,
-                contW,
-                contW,
-                sd_mx,
-                contS,
-            )
-        )
         p1_y = p1_y + metWidth - sd_adj + sd_row_sp
         p2_y = p1_y
 
     # Metal2 + Via1 for first S/D region
     if met2_cont:
-        if cnt_rows > 1:
-            sd_shapes.append((layer_metal2, sd_mx, sd_my, W - sd_mx, ec - sd_mx - dce))
-
         p1_x = sd_mx
         p2_x = W - sd_mx
-        p1_y = sd_my + metWidth * 0.5 - via_enc
+        p1_y = sd_row_y0
         p2_y = p1_y
         for _i in range(1, cnt_rows + 1):
             _metal_cont(
@@ -382,7 +370,7 @@ def _rf_mos_core(
                 p2_y,
                 layer_metal2,
                 layer_via1,
-                viaW + via_enc,
+                via_met_w,
                 viaW,
                 viaW,
                 sd_mx,
@@ -390,22 +378,6 @@ def _rf_mos_core(
                 shift_x=ox,
                 shift_y=oy,
             )
-            sd_shapes.append(
-                (
-                    "metal_cont",
-                    p1_x,
-                    p1_y,
-                    p2_x,
-                    p2_y,
-                    layer_metal2,
-                    layer_via1,
-                    viaW + via_enc,
-                    viaW,
-                    viaW,
-                    sd_mx,
-                    viaS,
-                )
-            )
             p1_y = p1_y + metWidth - sd_adj + sd_row_sp
             p2_y = p1_y
 
@@ -417,7 +389,7 @@ def _rf_mos_core(
             ox + sd_mx,
             oy + sd_my,
             ox + (W - sd_mx),
-            oy + (ec - sd_mx - dce),
+            oy + sd_strip_yt,
         )
         if met2_cont:
             _add_rect(
@@ -426,7 +398,7 @@ def _rf_mos_core(
                 ox + sd_mx,
                 oy + sd_my,
                 ox + (W - sd_mx),
-                oy + (ec - sd_mx - dce),
+                oy + sd_strip_yt,
             )
 
     # -- Copy S/D structures for subsequent gate fingers --
@@ -444,7 +416,7 @@ def _rf_mos_core(
                 ox + sd_mx,
                 oy + sd_my + y_offset,
                 ox + (W - sd_mx),
-                oy + (ec - sd_mx - dce) + y_offset,
+                oy + sd_strip_yt + y_offset,
             )
             if met2_cont:
                 _add_rect(
@@ -453,13 +425,13 @@ def _rf_mos_core(
                     ox + sd_mx,
                     oy + sd_my + y_offset,
                     ox + (W - sd_mx),
-                    oy + (ec - sd_mx - dce) + y_offset,
+                    oy + sd_strip_yt + y_offset,
                 )
 
         # Copy metal+contact rows
         p1_x = sd_mx
         p2_x = W - sd_mx
-        p1_y = sd_my + metWidth * 0.5 - via_enc
+        p1_y = sd_row_y0
         p2_y = p1_y
         for _j in range(1, cnt_rows + 1):
             _metal_cont(
@@ -470,7 +442,7 @@ def _rf_mos_core(
                 p2_y + y_offset,
                 layer_metal1,
                 layer_cont,
-                metWidth - sd_adj,
+                sd_met_w,
                 contW,
                 contW,
                 sd_mx,
@@ -487,7 +459,7 @@ def _rf_mos_core(
                     p2_y + y_offset,
                     layer_metal2,
                     layer_via1,
-                    viaW + via_enc,
+                    via_met_w,
                     viaW,
                     viaW,
                     sd_mx,
@@ -505,7 +477,7 @@ def _rf_mos_core(
         ox + sd_mx,
         oy + sd_my,
         ox + (W - sd_mx),
-        oy + (ec - sd_mx - dce),
+        oy + sd_strip_yt,
     )
 
     # -- Drain pin --
@@ -522,7 +494,7 @@ def _rf_mos_core(
     src_pin_x1 = ox + sd_mx
     src_pin_y1 = oy + sd_my
     src_pin_x2 = ox + (W - sd_mx)
-    src_pin_y2 = oy + (ec - sd_mx - dce)
+    src_pin_y2 = oy + sd_strip_yt
     drn_pin_x1 = ox + sd_mx
     drn_pin_y1 = oy + (sd_my + y_step)
     drn_pin_x2 = ox + (W - sd_mx)
@@ -581,7 +553,7 @@ def _rf_mos_core(
         p2_y_gc,
         layer_metal1,
         layer_cont,
-        viaW + via_enc,
+        via_met_w,
         contW,
         contW,
         sd_mx,
@@ -607,7 +579,7 @@ def _rf_mos_core(
         p2_y_gc,
         layer_metal1,
         layer_cont,
-        viaW + via_enc,
+        via_met_w,
         contW,
         contW,
         sd_mx,
@@ -738,7 +710,7 @@ def _rf_mos_core(
     # -- Substrate isolation layers --
     if rfnmos:
         # pSD ring around guard ring
-        d = (wpsd - wguard) / 2
+        d = d_psd
         psd_xl = xl - d
         psd_xr = xr + d
         psd_yb = yb - d
@@ -778,22 +750,21 @@ def _rf_mos_core(
         cur_xl, cur_xr, cur_yb, cur_yt = psd_xl, psd_xr, psd_yb, psd_yt
     else:
         # rfpmos: pSD rect inside guard ring area
+        psd_ix = TECH.rf_psd_pmos_inset_x
+        psd_iy = TECH.rf_psd_pmos_inset_y
         _add_rect(
             c,
             layer_psd,
-            ox + (xl + TECH.rf_psd_pmos_inset_x),
-            oy + (yb + TECH.rf_psd_pmos_inset_y),
-            ox + (xr - TECH.rf_psd_pmos_inset_x),
-            oy + (yt - TECH.rf_psd_pmos_inset_y),
+            ox + (xl + psd_ix),
+            oy + (yb + psd_iy),
+            ox + (xr - psd_ix),
+            oy + (yt - psd_iy),
         )
         cur_xl, cur_xr, cur_yb, cur_yt = xl, xr, yb, yt
 
     # -- ThickGateOx for HV --
     if is_hv:
-        if rfnmos:
-            d = TECH.rf_tgo_nmos
-        else:
-            d = TECH.rf_tgo_pmos
+        d = d_tgo
         cur_xl = cur_xl - d
         cur_xr = cur_xr + d
         cur_yb = cur_yb - d
@@ -809,10 +780,7 @@ def _rf_mos_core(
 
     # -- NWell for rfpmos --
     if not rfnmos:
-        if is_hv:
-            d = TECH.rf_nw_pmos_hv
-        else:
-            d = TECH.rf_nw_pmos_lv
+        d = d_nw
         cur_xl = cur_xl - d
         cur_xr = cur_xr + d
         cur_yb = cur_yb - d
@@ -881,6 +849,26 @@ def _rf_mos_core(
     return c
 
 
+def _rf_vlsir(
+    model: str, spice_lib: str, width: float, length: float, nf: int, m: int
+) -> dict:
+    """Return the VLSIR netlist metadata shared by all RF-MOS cells."""
+    return {
+        "model": model,
+        "spice_type": "SUBCKT",
+        "spice_lib": spice_lib,
+        "port_order": ["d", "g", "s", "b"],
+        "port_map": {"D": "d", "G": "g", "S": "s"},
+        "params": {
+            "w": width * 1e-6,
+            "l": length * 1e-6,
+            "ng": nf,
+            "m": m,
+            "rfmode": 1,
+        },
+    }
+
+
 # ---------------------------------------------------------------------------
 # Public RF cell functions
 # ---------------------------------------------------------------------------
@@ -937,20 +925,9 @@ def rfnmos(
         is_pmos=False,
         is_hv=False,
     )
-    c.info["vlsir"] = {
-        "model": "sg13_lv_nmos",
-        "spice_type": "SUBCKT",
-        "spice_lib": "sg13g2_moslv_mod.lib",
-        "port_order": ["d", "g", "s", "b"],
-        "port_map": {"D": "d", "G": "g", "S": "s"},
-        "params": {
-            "w": width * 1e-6,
-            "l": length * 1e-6,
-            "ng": nf,
-            "m": m,
-            "rfmode": 1,
-        },
-    }
+    c.info["vlsir"] = _rf_vlsir(
+        "sg13_lv_nmos", "sg13g2_moslv_mod.lib", width, length, nf, m
+    )
     return c
 
 
@@ -1007,20 +984,9 @@ def rfpmos(
         is_pmos=True,
         is_hv=False,
     )
-    c.info["vlsir"] = {
-        "model": "sg13_lv_pmos",
-        "spice_type": "SUBCKT",
-        "spice_lib": "sg13g2_moslv_mod.lib",
-        "port_order": ["d", "g", "s", "b"],
-        "port_map": {"D": "d", "G": "g", "S": "s"},
-        "params": {
-            "w": width * 1e-6,
-            "l": length * 1e-6,
-            "ng": nf,
-            "m": m,
-            "rfmode": 1,
-        },
-    }
+    c.info["vlsir"] = _rf_vlsir(
+        "sg13_lv_pmos", "sg13g2_moslv_mod.lib", width, length, nf, m
+    )
     return c
 
 
@@ -1077,20 +1043,9 @@ def rfnmos_hv(
         is_pmos=False,
         is_hv=True,
     )
-    c.info["vlsir"] = {
-        "model": "sg13_hv_nmos",
-        "spice_type": "SUBCKT",
-        "spice_lib": "sg13g2_moshv_mod.lib",
-        "port_order": ["d", "g", "s", "b"],
-        "port_map": {"D": "d", "G": "g", "S": "s"},
-        "params": {
-            "w": width * 1e-6,
-            "l": length * 1e-6,
-            "ng": nf,
-            "m": m,
-            "rfmode": 1,
-        },
-    }
+    c.info["vlsir"] = _rf_vlsir(
+        "sg13_hv_nmos", "sg13g2_moshv_mod.lib", width, length, nf, m
+    )
     return c
 
 
@@ -1147,18 +1102,7 @@ def rfpmos_hv(
         is_pmos=True,
         is_hv=True,
     )
-    c.info["vlsir"] = {
-        "model": "sg13_hv_pmos",
-        "spice_type": "SUBCKT",
-        "spice_lib": "sg13g2_moshv_mod.lib",
-        "port_order": ["d", "g", "s", "b"],
-        "port_map": {"D": "d", "G": "g", "S": "s"},
-        "params": {
-            "w": width * 1e-6,
-            "l": length * 1e-6,
-            "ng": nf,
-            "m": m,
-            "rfmode": 1,
-        },
-    }
+    c.info["vlsir"] = _rf_vlsir(
+        "sg13_hv_pmos", "sg13g2_moshv_mod.lib", width, length, nf, m
+    )
     return c
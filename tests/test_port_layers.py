@@ -68,21 +68,31 @@ CELLS_TO_TEST = [
 ]
 
 
-def _resolve_layer(comp, port) -> tuple[int, int]:
-    """Resolve port layer index to (layer_number, datatype) tuple."""
-    layer_idx = port.layer
-    info = comp.kcl.layout.get_info(layer_idx)
-    return (info.layer, info.datatype)
-
-
-@pytest.mark.parametrize(
-    "name,factory,kwargs",
-    CELLS_TO_TEST,
+@pytest.fixture(
+    scope="module",
+    params=CELLS_TO_TEST,
     ids=[t[0] for t in CELLS_TO_TEST],
 )
-def test_port_type_is_electrical(name, factory, kwargs):
+def cell(request):
+    """Build each cell once and share it across the port checks below."""
+    PDK.activate()
+    name, factory, kwargs = request.param
+    return name, factory(**kwargs)
+
+
+def _port_layer_infos(comp) -> dict[int, tuple[int, int]]:
+    """Map each port layer index to its (layer_number, datatype) tuple."""
+    layout = comp.kcl.layout
+    infos = {}
+    for layer_idx in {port.layer for port in comp.ports}:
+        info = layout.get_info(layer_idx)
+        infos[layer_idx] = (info.layer, info.datatype)
+    return infos
+
+
+def test_port_type_is_electrical(cell):
     """Every port on a physical cell must have port_type='electrical'."""
-    comp = factory(**kwargs)
+    name, comp = cell
     assert len(comp.ports) > 0, f"{name} has no ports"
     for port in comp.ports:
         assert port.port_type == "electrical", (
@@ -91,50 +101,48 @@ def test_port_type_is_electrical(name, factory, kwargs):
         )
 
 
-@pytest.mark.parametrize(
-    "name,factory,kwargs",
-    CELLS_TO_TEST,
-    ids=[t[0] for t in CELLS_TO_TEST],
-)
-def test_port_layer_is_pin_sublayer(name, factory, kwargs):
+def test_port_layer_is_pin_sublayer(cell):
     """Every port layer must be a pin sublayer (datatype == 2), not drawing (0)."""
-    comp = factory(**kwargs)
+    name, comp = cell
     assert len(comp.ports) > 0, f"{name} has no ports"
+    layer_infos = _port_layer_infos(comp)
     for port in comp.ports:
-        layer_num, datatype = _resolve_layer(comp, port)
+        layer_num, datatype = layer_infos[port.layer]
         assert datatype == 2, (
             f"{name}.ports['{port.name}'] layer=({layer_num}, {datatype}), "
             f"expected datatype=2 (pin sublayer)"
         )
 
 
-@pytest.mark.parametrize(
-    "name,factory,kwargs",
-    CELLS_TO_TEST,
-    ids=[t[0] for t in CELLS_TO_TEST],
-)
-def test_port_pin_overlaps_drawing(name, factory, kwargs):
+def test_port_pin_overlaps_drawing(cell):
     """Each port's pin sublayer must overlap drawing geometry on the same layer number."""
-    comp = factory(**kwargs)
+    name, comp = cell
     assert len(comp.ports) > 0, f"{name} has no ports"
     kcell = comp._kf_cell if hasattr(comp, "_kf_cell") else comp
     layout = kcell.layout()
+    dbu = layout.dbu
+    draw_regions: dict[int, kdb.Region] = {}
+    layer_infos = _port_layer_infos(comp)
 
     for port in comp.ports:
-        layer_num, _datatype = _resolve_layer(comp, port)
+        layer_num, _datatype = layer_infos[port.layer]
         draw_li = layout.find_layer(layer_num, 0)
         assert draw_li is not None, (
             f"{name}.ports['{port.name}'] pin layer ({layer_num}, 2) "
             f"has no corresponding drawing layer ({layer_num}, 0)"
         )
 
-        draw_region = kdb.Region(kcell.begin_shapes_rec(draw_li))
-        dbu = layout.dbu
+        # Ports on the same layer share one flattened drawing region
+        draw_region = draw_regions.get(draw_li)
+        if draw_region is None:
+            draw_region = kdb.Region(kcell.begin_shapes_rec(draw_li))
+            draw_regions[draw_li] = draw_region
         x, y = port.center
         x_dbu = int(round(x / dbu))
         y_dbu = int(round(y / dbu))
         probe = kdb.Region(kdb.Box(x_dbu - 10, y_dbu - 10, x_dbu + 10, y_dbu + 10))
-        overlap = draw_region & probe
+        # Selecting the probe by overlap avoids computing the boolean AND
+        overlap = probe.overlapping(draw_region)
         assert not overlap.is_empty(), (
             f"{name}.ports['{port.name}'] at ({x}, {y}) on pin layer "
             f"({layer_num}, 2) does not overlap drawing geometry on ({layer_num}, 0)"
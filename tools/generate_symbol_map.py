@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 import ast
-import re
 from pathlib import Path
 
 import yaml
 
+try:  # libyaml-backed emitter when PyYAML was built with it
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper
+
 # -------------------------------------------------------------------
 # Folders inside IHP/ihp
 # -------------------------------------------------------------------
@@ -19,15 +23,19 @@ EXCLUDE_FILES = {"__init__.py", "fixed.py", "ihp_pycell"}  # files to ignore
 # -------------------------------------------------------------------
 def normalize(name: str) -> str:
     """Normalize CamelCase and snake_case to comparable lowercase string."""
-    return re.sub(r"_", "", name).lower()
+    return name.replace("_", "").lower()
 
 
 def get_classes_from_file(py_file: Path):
     """Extract class names inheriting from DloGen."""
     classes = []
-    with py_file.open() as f:
-        tree = ast.parse(f.read(), filename=str(py_file))
-    for node in ast.walk(tree):
+    source = py_file.read_text()
+    # Only parse files that can contain a match
+    if "DloGen" not in source:
+        return classes
+    tree = ast.parse(source, filename=str(py_file))
+    # Cells and PyCell classes are only defined at module level
+    for node in tree.body:
         if isinstance(node, ast.ClassDef):
             for base in node.bases:
                 if isinstance(base, ast.Name) and base.id == "DloGen":
@@ -38,9 +46,13 @@ def get_classes_from_file(py_file: Path):
 def get_cells_from_file(py_file: Path):
     """Return a list of gf.cell function names in a Python file."""
     cells = []
-    with py_file.open() as f:
-        tree = ast.parse(f.read(), filename=str(py_file))
-    for node in ast.walk(tree):
+    source = py_file.read_text()
+    # Only parse files that can contain a match
+    if "@gf.cell" not in source and "@cell" not in source:
+        return cells
+    tree = ast.parse(source, filename=str(py_file))
+    # Cells and PyCell classes are only defined at module level
+    for node in tree.body:
         if isinstance(node, ast.FunctionDef):
             for decorator in node.decorator_list:
                 # @gf.cell
@@ -110,5 +122,5 @@ if __name__ == "__main__":
     smap = generate_symbol_map()
     out_file = Path("tools") / "symbol_map.yml"
     with open(out_file, "w") as f:
-        yaml.dump(smap, f, sort_keys=True)
+        yaml.dump(smap, f, Dumper=Dumper, sort_keys=True)
     print(f"Symbol map saved to {out_file}")
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 
+import functools
 import re
 import sys
-from collections import defaultdict
 from pathlib import Path
 
 import yaml
 
+try:  # libyaml-backed emitter when PyYAML was built with it
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper
+
 # -------------------------------------------------------------------
 # Constants
 # -------------------------------------------------------------------
@@ -36,13 +41,17 @@ IGNORED_SYMBOLS = {
 # -------------------------------------------------------------------
 
 # C {symbol.sym} x y rot mirror { properties }
+# The negated classes already span newlines and cannot overlap their
+# delimiters, so there is no nested backtracking and no need for DOTALL.
 COMPONENT_RE = re.compile(
-    r"C\s+\{([^}]+)\}\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+\{([^}]*)\}",
-    re.DOTALL,
+    r"C\s+\{([^}]+)\}\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+\{([^}]*)\}"
 )
 
 PROPERTY_RE = re.compile(r"(\w+)\s*=\s*([^\s]+)")
 
+# SPICE unit suffix → scale to microns
+_UNIT_MULT = {"u": 1.0, "n": 1e-3, "p": 1e-6, "m": 1e6}
+
 # -------------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------------
@@ -50,20 +59,18 @@ PROPERTY_RE = re.compile(r"(\w+)\s*=\s*([^\s]+)")
 
 def parse_value(value: str):
     """Convert SPICE-style units to microns when numeric."""
-    units = {"u": 1.0, "n": 1e-3, "p": 1e-6, "m": 1e6}
-    last = value[-1]
-    if last in units:
-        try:
-            return float(value[:-1]) * units[last]
-        except ValueError:
-            return value
+    if not value:
+        return value
+    mult = _UNIT_MULT.get(value[-1])
     try:
+        if mult is not None:
+            return float(value[:-1]) * mult
         v = float(value)
-        if abs(v) < 1e-2:
-            return v * 1e6
-        return v
     except ValueError:
         return value
+    if abs(v) < 1e-2:
+        return v * 1e6
+    return v
 
 
 def clean_number(value, ndigits=4):
@@ -72,6 +79,17 @@ def clean_number(value, ndigits=4):
     return value
 
 
+@functools.lru_cache(maxsize=4096)
+def _setting_value(value: str):
+    """Cached ``clean_number(parse_value(value))``; most values repeat."""
+    return clean_number(parse_value(value))
+
+
+def _to_um(x: str, y: str) -> tuple[float, float]:
+    """Convert xschem coordinates to microns (y axis flipped)."""
+    return round(float(x) * XSCHEM_TO_UM, 4), round(-float(y) * XSCHEM_TO_UM, 4)
+
+
 def extract_component_name(symbol: str) -> str:
     return symbol.split("/")[-1].replace(".sym", "")
 
@@ -97,10 +115,8 @@ def parse_xschem_sch(filepath: Path):
 
         # Top-level ports
         if sym in TOP_LEVEL_PORTS and lab:
-            top_ports[lab] = {
-                "x": round(float(x) * XSCHEM_TO_UM, 4),
-                "y": round(-float(y) * XSCHEM_TO_UM, 4),
-            }
+            xu, yu = _to_um(x, y)
+            top_ports[lab] = {"x": xu, "y": yu}
             continue
 
         # Ignore decorations
@@ -111,19 +127,16 @@ def parse_xschem_sch(filepath: Path):
             continue
 
         component = extract_component_name(symbol)
-        settings = {
-            k: clean_number(parse_value(v))
-            for k, v in properties.items()
-            if k != "name"
-        }
+        settings = {k: _setting_value(v) for k, v in properties.items() if k != "name"}
 
         instances[name] = {"component": component}
         if settings:
             instances[name]["settings"] = settings
 
+        xu, yu = _to_um(x, y)
         placements[name] = {
-            "x": round(float(x) * XSCHEM_TO_UM, 4),
-            "y": round(-float(y) * XSCHEM_TO_UM, 4),
+            "x": xu,
+            "y": yu,
             "rotation": int(rot),
             "mirror": int(mirror),
         }
@@ -137,75 +150,60 @@ def parse_xschem_sch(filepath: Path):
 
 
 def parse_spice_netlist(filepath: Path):
-    net_to_pins = defaultdict(list)
+    net_to_pins = {}
     spice_instances = {}
 
-    for line in filepath.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("*") or not line[0].upper() == "X":
-            continue
-        tokens = line.split()
-        name = tokens[0][1:]  # strip leading X
-        nodes_raw = tokens[1:-1]  # everything between instance name and model
-        model = tokens[-1]
-
-        # Filter only tokens that are nets (ignore w=, l=, etc.)
-        nets = [n for n in nodes_raw if "=" not in n]
-
-        spice_instances[name] = {"nodes": nets, "model": model}
-
-        # Map net → instance,pin (p1, p2, ...)
-        for idx, net in enumerate(nets):
-            pin_name = f"p{idx + 1}"
-            net_to_pins[net].append(f"{name},{pin_name}")
+    with filepath.open() as fh:
+        for line in fh:
+            # Only subcircuit instances (X...); also skips blanks and comments.
+            # Test the raw first character before paying for lstrip().
+            if line[0] not in "Xx":
+                line = line.lstrip()
+                if not line or line[0] not in "Xx":
+                    continue
+            tokens = line.split()
+            name = tokens[0][1:]  # strip leading X
+            nodes_raw = tokens[1:-1]  # everything between instance name and model
+            model = tokens[-1]
+
+            # Filter only tokens that are nets (ignore w=, l=, etc.)
+            nets = [n for n in nodes_raw if "=" not in n]
+
+            spice_instances[name] = {"nodes": nets, "model": model}
+
+            # Map net → instance,pin (p1, p2, ...)
+            for idx, net in enumerate(nets, 1):
+                pin = f"{name},p{idx}"
+                pins = net_to_pins.get(net)
+                if pins is None:
+                    net_to_pins[net] = [pin]
+                else:
+                    pins.append(pin)
 
     return spice_instances, net_to_pins
 
 
 # -------------------------------------------------------------------
-# Map top-level ports to instance pins
+# Map top-level ports to instance pins, connections and routes
 # -------------------------------------------------------------------
 
 
-# -------------------------------------------------------------------
-# Map top-level ports to instance pins and external connections
-# -------------------------------------------------------------------
-# map_ports_to_instances()
-def map_ports_to_instances(top_ports, net_to_pins):
+def build_connections_and_routes(top_ports, net_to_pins):
+    """Build ports, connections and routes in a single pass over the nets."""
     ports = {}
     connections = {}
-    for _net, pins in net_to_pins.items():
+    routes = {}
+    for net, pins in net_to_pins.items():
         if len(pins) > 1:
             # connect first pin to others
             first = pins[0]
             for other in pins[1:]:
                 connections[first] = other
 
-    for port_label, _coords in top_ports.items():
-        if port_label in net_to_pins:
-            ports[port_label] = net_to_pins[port_label][0]  # pick one instance pin
-
-    return ports, connections
-
-
-# -------------------------------------------------------------------
-# Generate routes from net_to_pins
-# -------------------------------------------------------------------
-
-
-def generate_routes(net_to_pins):
-    routes = {}
-    for net, pins in net_to_pins.items():
-        if len(pins) > 1:
             # create a route name from net
-            route_name = f"route_{net}"
-            first_pin = pins[0]
-            routes[route_name] = {
-                "links": {
-                    first_pin: pins[
-                        1
-                    ]  # connect first pin to second pin; extendable if more
-                },
+            routes[f"route_{net}"] = {
+                # connect first pin to second pin; extendable if more
+                "links": {first: pins[1]},
                 # NOTE: The `settings` section must be filled manually by the user.
                 "settings": {
                     "cross_section": "strip",  # placeholder
@@ -213,7 +211,21 @@ def generate_routes(net_to_pins):
                     # add other waveguide or route parameters manually
                 },
             }
-    return routes
+
+    for port_label in top_ports:
+        if port_label in net_to_pins:
+            ports[port_label] = net_to_pins[port_label][0]  # pick one instance pin
+
+    return ports, connections, routes
+
+
+def map_ports_to_instances(top_ports, net_to_pins):
+    ports, connections, _ = build_connections_and_routes(top_ports, net_to_pins)
+    return ports, connections
+
+
+def generate_routes(net_to_pins):
+    return build_connections_and_routes({}, net_to_pins)[2]
 
 
 # -------------------------------------------------------------------
@@ -226,7 +238,7 @@ def write_yaml(data, outfile: Path):
         if "routes_comment" in data:
             f.write(f"# {data['routes_comment']}\n")
             del data["routes_comment"]
-        yaml.dump(data, f, sort_keys=False, default_flow_style=False)
+        yaml.dump(data, f, Dumper=Dumper, sort_keys=False, default_flow_style=False)
 
 
 # -------------------------------------------------------------------
@@ -258,14 +270,15 @@ if __name__ == "__main__":
 
     if spice_file:
         spice_instances, net_to_pins = parse_spice_netlist(spice_file)
-        ports, connections = map_ports_to_instances(top_ports, net_to_pins)
+        ports, connections, routes = build_connections_and_routes(
+            top_ports, net_to_pins
+        )
         if ports:
             data["ports"] = ports
         if connections:
             data["connections"] = connections
 
         # Automatically generate routes from nets
-        routes = generate_routes(net_to_pins)
         if routes:
             data["routes"] = routes
             data["routes_comment"] = (
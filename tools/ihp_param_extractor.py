@@ -4,6 +4,11 @@ from pathlib import Path
 
 import yaml
 
+try:  # libyaml-backed emitter when PyYAML was built with it
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 IHPPYCELL_DIR = Path("ihp/cells2/ihp_pycell")  # folder with pycell classes
 
 
@@ -11,10 +16,11 @@ def extract_sch_param_descriptions(py_file: Path):
     """Return {class_name: {sch_arg: description}}"""
     param_map = {}
 
-    with py_file.open() as f:
-        tree = ast.parse(f.read(), filename=str(py_file))
+    # ast.parse takes the raw bytes and handles source decoding itself
+    tree = ast.parse(py_file.read_bytes(), filename=str(py_file))
 
-    for node in ast.walk(tree):
+    # PyCell classes are only defined at module level
+    for node in tree.body:
         if isinstance(node, ast.ClassDef):
             class_name = node.name
             param_map[class_name] = {}
@@ -23,7 +29,12 @@ def extract_sch_param_descriptions(py_file: Path):
                     isinstance(item, ast.FunctionDef)
                     and item.name == "defineParamSpecs"
                 ):
-                    for stmt in ast.walk(item):
+                    # specs(...) calls are plain statements of the method body,
+                    # so there is no need to walk it a second time
+                    for expr in item.body:
+                        if not isinstance(expr, ast.Expr):
+                            continue
+                        stmt = expr.value
                         if isinstance(stmt, ast.Call):
                             if getattr(stmt.func, "id", None) == "specs":
                                 if stmt.args and isinstance(stmt.args[0], ast.Constant):
@@ -51,5 +62,5 @@ if __name__ == "__main__":
 
     out_file = Path("ihp_sch_param_descriptions.yml")
     with open(out_file, "w") as f:
-        yaml.dump(all_param_map, f, sort_keys=True)
+        yaml.dump(all_param_map, f, Dumper=SafeDumper, sort_keys=True)
     print(f"Extracted .sch parameter descriptions saved to {out_file}")
@@ -1,3 +1,4 @@
+import argparse
 import ast
 import os
 from difflib import SequenceMatcher
@@ -5,6 +6,12 @@ from pprint import pprint
 
 import yaml
 
+try:  # libyaml-backed loader/emitter when PyYAML was built with it
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 # --- CONFIG ---
 
 IHPS_DIRS = [
@@ -15,6 +22,10 @@ YAML_FILE = "ihp_sch_param_descriptions.yml"
 MAPPING_FILE = "ihp_to_gds_mapping.yml"
 SIMILARITY_THRESHOLD = 0.5  # Minimum similarity score (0-1)
 
+# (argument, description value) -> ratio; both lowercased. Argument names
+# and descriptions repeat across components, so pairs recur between calls.
+_RATIO_CACHE = {}
+
 
 # --- FUNCTIONS ---
 
@@ -22,16 +33,18 @@ SIMILARITY_THRESHOLD = 0.5  # Minimum similarity score (0-1)
 def load_yaml_descriptions(yaml_file):
     """Load argument descriptions from YAML."""
     with open(yaml_file) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def extract_pcell_args(py_file):
     """Extract function arguments and defaults from @gf.cell decorated functions."""
-    with open(py_file) as f:
+    # ast.parse takes the raw bytes and handles source decoding itself
+    with open(py_file, "rb") as f:
         tree = ast.parse(f.read(), filename=py_file)
 
     pcells = {}
-    for node in ast.walk(tree):
+    # @gf.cell functions are only defined at module level
+    for node in tree.body:
         if isinstance(node, ast.FunctionDef):
             # Check if function has @gf.cell decorator
             has_gf_cell = any(
@@ -76,9 +89,16 @@ def map_pcell_to_gds(pcell_args_with_defaults, descriptions):
     """
     mapping = {}
 
-    def similarity(s1, s2):
-        """Calculate similarity score between two strings (0-1)."""
-        return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
+    # Lowercased key -> first matching description key, built once per component
+    lower_index = {}
+    for desc_key in descriptions:
+        lower_index.setdefault(desc_key.lower(), desc_key)
+
+    # Description values are compared against every fuzzy argument: lowercase
+    # them once and keep one matcher each, with the value as seq2 so its b2j
+    # index is built only once per component. Built on first use, since
+    # layer_* and exactly matched args never reach the fuzzy path.
+    desc_matchers = None
 
     # For each @gf.cell argument, try to find a matching schematic description
     for pcell_arg, default_val in pcell_args_with_defaults.items():
@@ -90,20 +110,42 @@ def map_pcell_to_gds(pcell_args_with_defaults, descriptions):
             matched_desc_key = pcell_arg
         else:
             # Try case-insensitive exact match
-            for desc_key in descriptions.keys():
-                if desc_key.lower() == pcell_arg.lower():
-                    matched_desc_key = desc_key
-                    break
+            matched_desc_key = lower_index.get(pcell_arg.lower())
 
         # For non-layer arguments, try fuzzy matching on description values
         if not matched_desc_key and not pcell_arg.startswith("layer_"):
-            for desc_key, desc_value in descriptions.items():
+            if desc_matchers is None:
+                # Empty descriptions score 0 and can never match
+                desc_matchers = [
+                    (k, SequenceMatcher(None, "", v.lower()))
+                    for k, v in descriptions.items()
+                    if v
+                ]
+            pcell_arg_lower = pcell_arg.lower()
+            for desc_key, matcher in desc_matchers:
                 # Match against description values (not keys) - more semantic
-                value_sim = similarity(pcell_arg, desc_value)
+                if matcher.b == pcell_arg_lower:
+                    # Identical strings score 1.0, which nothing can beat
+                    matched_desc_key = desc_key
+                    break
+                matcher.set_seq1(pcell_arg_lower)
+                # Skip the full ratio() when a cheap upper bound rules it out
+                cutoff = max(best_similarity, SIMILARITY_THRESHOLD)
+                if (
+                    matcher.real_quick_ratio() < cutoff
+                    or matcher.quick_ratio() < cutoff
+                ):
+                    continue
+                key = (pcell_arg_lower, matcher.b)
+                value_sim = _RATIO_CACHE.get(key)
+                if value_sim is None:
+                    value_sim = _RATIO_CACHE[key] = matcher.ratio()
 
                 if value_sim > best_similarity and value_sim >= SIMILARITY_THRESHOLD:
                     best_similarity = value_sim
                     matched_desc_key = desc_key
+                    if best_similarity == 1.0:
+                        break  # a perfect score cannot be beaten
 
         # If matched, map to description key; otherwise use default
         mapping[pcell_arg] = matched_desc_key if matched_desc_key else default_val
@@ -114,14 +156,25 @@ def map_pcell_to_gds(pcell_args_with_defaults, descriptions):
 def save_mapping(mapping, filename=MAPPING_FILE):
     """Save mapping to YAML file."""
     with open(filename, "w") as f:
-        yaml.dump(mapping, f)
+        yaml.dump(mapping, f, Dumper=SafeDumper)
     print(f"Mapping saved to {filename}")
 
 
 # --- MAIN ---
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Map @gf.cell arguments to IHP schematic parameters"
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print the full mapping before saving it",
+    )
+    options = parser.parse_args(argv)
+
     # 1. Load YAML descriptions
     descriptions = load_yaml_descriptions("ihp_sch_param_descriptions.yml")
 
@@ -130,24 +183,28 @@ def main():
     for dir_path in IHPS_DIRS:
         if not os.path.exists(dir_path):
             continue
-        for filename in sorted(os.listdir(dir_path)):  # Sort for consistent ordering
-            if filename.endswith(".py") and filename != "fixed.py":  # Skip fixed.py
-                pcells = extract_pcell_args(os.path.join(dir_path, filename))
-                for name, args in pcells.items():
-                    # Keep the first version found (from higher priority directory)
-                    if name not in all_pcell_args:
-                        all_pcell_args[name] = args
+        with os.scandir(dir_path) as it:
+            entries = [
+                entry
+                for entry in it
+                if entry.name.endswith(".py") and entry.name != "fixed.py"
+            ]  # Skip fixed.py
+        for entry in sorted(entries, key=lambda e: e.name):  # Consistent ordering
+            pcells = extract_pcell_args(entry.path)
+            for name, args in pcells.items():
+                # Keep the first version found (from higher priority directory)
+                if name not in all_pcell_args:
+                    all_pcell_args[name] = args
 
     # 3. Map PCell args to schematic descriptions
     gds_mapping = {}
-    for comp_name in all_pcell_args.keys():
+    for comp_name, pcell_args in all_pcell_args.items():
         comp_descriptions = descriptions.get(comp_name, {})
-        gds_mapping[comp_name] = map_pcell_to_gds(
-            all_pcell_args[comp_name], comp_descriptions
-        )
+        gds_mapping[comp_name] = map_pcell_to_gds(pcell_args, comp_descriptions)
 
     # 4. Print and save
-    pprint(gds_mapping)
+    if options.verbose:
+        pprint(gds_mapping)
     save_mapping(gds_mapping)
 
 